@@ -8,10 +8,10 @@ Usage:
 """
 
 import os
-import yaml
 import logging
 from dotenv import load_dotenv
 from src.autogen_orchestrator import AutoGenOrchestrator
+from src.config import load_config as _load_config
 
 
 def setup_logging():
@@ -28,8 +28,7 @@ def setup_logging():
 
 def load_config():
     """Load configuration from config.yaml."""
-    with open("config.yaml", "r") as f:
-        return yaml.safe_load(f)
+    return _load_config("config.yaml")
 
 
 def print_separator(title: str = ""):
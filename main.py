@@ -6,6 +6,7 @@ Usage:
   python main.py --mode cli           # Run CLI interface
   python main.py --mode web           # Run web interface
   python main.py --mode evaluate      # Run evaluation
+  python main.py --mode autogen       # Run AutoGen example (add --spawn for a subprocess)
 """
 
 import argparse
@@ -29,34 +30,49 @@ def run_web():
 
 async def run_evaluation():
     """Run system evaluation with LLM-as-a-Judge."""
-    import yaml
+    from concurrent.futures import ThreadPoolExecutor
     from dotenv import load_dotenv
     from src.autogen_orchestrator import AutoGenOrchestrator
+    from src.config import load_config
     from src.evaluation.evaluator import SystemEvaluator
     
     # Load environment variables
     load_dotenv()
 
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
 
     # Initialize AutoGen orchestrator
     print("Initializing AutoGen orchestrator...")
     orchestrator = AutoGenOrchestrator(config)
     
-    # Initialize SystemEvaluator with orchestrator
-    print("Initializing SystemEvaluator with LLM-as-a-Judge...")
-    evaluator = SystemEvaluator(config, orchestrator=orchestrator)
+    # One pool for the judge's blocking API calls, shared by all queries
+    max_workers = config.get("evaluation", {}).get("max_concurrency", 8)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="judge")
     
-    print("\n" + "=" * 70)
-    print("RUNNING LLM-AS-A-JUDGE EVALUATION")
-    print("=" * 70)
-    print("\nThis will evaluate the system on diverse test queries.")
-    print("Each response will be scored by an LLM judge.\n")
-    
-    # Run evaluation on example queries
-    report = await evaluator.evaluate_system("data/example_queries.json")
+    try:
+        # Initialize SystemEvaluator with orchestrator
+        print("Initializing SystemEvaluator with LLM-as-a-Judge...")
+        evaluator = SystemEvaluator(config, orchestrator=orchestrator, executor=executor)
+        
+        print("\n" + "=" * 70)
+        print("RUNNING LLM-AS-A-JUDGE EVALUATION")
+        print("=" * 70)
+        print("\nThis will evaluate the system on diverse test queries.")
+        print("Each response will be scored by an LLM judge.\n")
+        
+        # Run evaluation on example queries, reporting each as it finishes
+        done = 0
+        async for result in evaluator.evaluate_system_stream("data/example_queries.json"):
+            done += 1
+            score = result.get("evaluation", {}).get("overall_score")
+            status = f"score {score:.3f}" if score is not None else "error"
+            print(f"[{done}] {status}: {result.get('query', '')[:60]}")
+
+        report = evaluator.finalize_report()
+    finally:
+        executor.shutdown()
+        await orchestrator.close()
     
     # Display summary
     print("\n" + "=" * 70)
@@ -79,11 +95,22 @@ async def run_evaluation():
     print("=" * 70)
 
 
-def run_autogen():
-    """Run AutoGen example."""
-    import subprocess
+def run_autogen(spawn: bool = False):
+    """
+    Run AutoGen example.
+
+    Args:
+        spawn: Run the example in a separate Python process instead of
+            importing it into this one
+    """
     print("Running AutoGen example...")
-    subprocess.run([sys.executable, "example_autogen.py"])
+    if spawn:
+        import subprocess
+        subprocess.run([sys.executable, "example_autogen.py"])
+        return
+
+    import example_autogen
+    example_autogen.main()
 
 
 def main():
@@ -102,6 +129,11 @@ def main():
         default="config.yaml",
         help="Path to configuration file"
     )
+    parser.add_argument(
+        "--spawn",
+        action="store_true",
+        help="Run the autogen example in a separate Python process"
+    )
 
     args = parser.parse_args()
 
@@ -112,7 +144,7 @@ def main():
     elif args.mode == "evaluate":
         asyncio.run(run_evaluation())
     elif args.mode == "autogen":
-        run_autogen()
+        run_autogen(spawn=args.spawn)
 
 
 if __name__ == "__main__":
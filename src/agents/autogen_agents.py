@@ -8,32 +8,123 @@ Based on the AutoGen literature review example:
 https://microsoft.github.io/autogen/stable/user-guide/agentchat-user-guide/examples/literature-review.html
 """
 
+from __future__ import annotations
+
+import asyncio
 import os
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_agentchat.conditions import TextMentionTermination
-from autogen_core.tools import FunctionTool
-from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_core.models import ModelFamily
-# Import our research tools
-from src.tools.web_search import web_search
-from src.tools.paper_search import paper_search
 
+# The OpenAI client and the research tools are imported where they are used,
+# so importing this module doesn't pull in openai/httpx or the search SDKs.
+if TYPE_CHECKING:
+    from autogen_core.models import ChatCompletionClient
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+# Model clients keyed by (event loop, provider, model name, base URL, API key).
+# The orchestrator rebuilds the team for every query, so reusing the client
+# keeps its HTTP connection pool alive instead of reconnecting each time. The
+# pool is bound to the loop it was opened on, hence the loop in the key.
+_MODEL_CLIENT_CACHE: Dict[tuple, ChatCompletionClient] = {}
 
-def create_model_client(config: Dict[str, Any]) -> OpenAIChatCompletionClient:
+
+def create_model_client(config: Dict[str, Any]) -> ChatCompletionClient:
     """
     Create model client for AutoGen agents.
     
+    Clients are cached per event loop and provider/model/endpoint/key, so
+    repeated calls with the same settings on the same loop return the same
+    instance. Unless disabled via
+    models.default.inference_worker.enabled, the client's requests are routed
+    through an InferenceWorker so concurrent queries share one in-flight limit.
+    
     Args:
         config: Configuration dictionary from config.yaml
         
     Returns:
-        OpenAIChatCompletionClient configured for the specified provider
+        ChatCompletionClient configured for the specified provider
     """
     model_config = config.get("models", {}).get("default", {})
     provider = model_config.get("provider", "groq")
     
+    loop = _running_loop()
+    _evict_closed_loops()
+    
+    if provider == "groq":
+        cache_key = (loop, provider, model_config.get("name"), None, os.getenv("GROQ_API_KEY"))
+    else:
+        cache_key = (
+            loop,
+            provider,
+            model_config.get("name"),
+            os.getenv("OPENAI_BASE_URL"),
+            os.getenv("OPENAI_API_KEY"),
+        )
+    
+    client = _MODEL_CLIENT_CACHE.get(cache_key)
+    if client is None:
+        client = _build_model_client(provider, model_config)
+        
+        worker_config = model_config.get("inference_worker", {})
+        if worker_config.get("enabled", True):
+            from src.infra.llm_worker import InferenceWorker, QueuedChatCompletionClient
+            worker = InferenceWorker(
+                client,
+                max_in_flight=worker_config.get("max_in_flight", 8),
+            )
+            client = QueuedChatCompletionClient(client, worker)
+        
+        _MODEL_CLIENT_CACHE[cache_key] = client
+    return client
+
+
+async def close_model_clients():
+    """
+    Close the cached model clients created on the running event loop.
+    
+    Later create_model_client() calls on this loop build fresh clients.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _MODEL_CLIENT_CACHE if key[0] is loop]:
+        await _MODEL_CLIENT_CACHE.pop(key).close()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _evict_closed_loops():
+    """
+    Drop cached clients whose event loop has been closed.
+    
+    Their connections died with the loop and can't be closed from another
+    one, so they are left to the garbage collector.
+    """
+    for key in [key for key in _MODEL_CLIENT_CACHE if key[0] is not None and key[0].is_closed()]:
+        del _MODEL_CLIENT_CACHE[key]
+
+
+def _build_model_client(provider: str, model_config: Dict[str, Any]) -> OpenAIChatCompletionClient:
+    """
+    Build a new model client for the given provider.
+    
+    Args:
+        provider: Model provider ("groq", "openai" or "vllm")
+        model_config: The models.default section of config.yaml
+        
+    Returns:
+        OpenAIChatCompletionClient configured for the provider
+    """
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+    from autogen_core.models import ModelFamily
+
     # Groq configuration (uses OpenAI-compatible API)
     if provider == "groq":
         api_key = os.getenv("GROQ_API_KEY")
@@ -87,7 +178,7 @@ def create_model_client(config: Dict[str, Any]) -> OpenAIChatCompletionClient:
         raise ValueError(f"Unsupported provider: {provider}")
 
 
-def create_planner_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
+def create_planner_agent(config: Dict[str, Any], model_client: ChatCompletionClient) -> AssistantAgent:
     """
     Create a Planner Agent using AutoGen.
     
@@ -124,12 +215,13 @@ def create_planner_agent(config: Dict[str, Any], model_client: OpenAIChatComplet
     return planner
 
 
-def create_researcher_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
+def create_researcher_agent(config: Dict[str, Any], model_client: ChatCompletionClient) -> AssistantAgent:
     """
     Create a Researcher Agent using AutoGen.
     
-    The researcher has access to web search and paper search tools.
-    It gathers evidence based on the planner's guidance.
+    The researcher has a single fused research_search tool that runs the web
+    search and the paper search concurrently, so all evidence is gathered in
+    one tool call. It gathers evidence based on the planner's guidance.
     
     Args:
         config: Configuration dictionary
@@ -142,7 +234,7 @@ def create_researcher_agent(config: Dict[str, Any], model_client: OpenAIChatComp
     
     # Load system prompt from config or use default
     # MINIMAL prompt to stay within Groq free tier (6000 TPM)
-    default_system_message = """You are a Researcher. Make ONE web_search and ONE paper_search call. Be concise."""
+    default_system_message = """You are a Researcher. Make ONE research_search call. Be concise."""
 
     # Use custom prompt from config if available
     custom_prompt = agent_config.get("system_prompt", "")
@@ -151,22 +243,20 @@ def create_researcher_agent(config: Dict[str, Any], model_client: OpenAIChatComp
     else:
         system_message = default_system_message
 
-    # Wrap tools in FunctionTool
-    web_search_tool = FunctionTool(
-        web_search,
-        description="Search the web for articles, blog posts, and general information. Returns formatted search results with titles, URLs, and snippets."
-    )
-    
-    paper_search_tool = FunctionTool(
-        paper_search,
-        description="Search academic papers on Semantic Scholar. Returns papers with authors, abstracts, citation counts, and URLs. Use year_from parameter to filter recent papers."
+    from autogen_core.tools import FunctionTool
+    from src.tools.research_search import research_search
+
+    # Wrap tool in FunctionTool
+    research_search_tool = FunctionTool(
+        research_search,
+        description="Search the web and Semantic Scholar at the same time. Returns web results (titles, URLs, snippets) followed by academic papers (authors, abstracts, URLs). Use year_from parameter to filter recent papers."
     )
 
     # Create the researcher with tool access
     researcher = AssistantAgent(
         name="Researcher",
         model_client=model_client,
-        tools=[web_search_tool, paper_search_tool],
+        tools=[research_search_tool],
         description="Gathers evidence from web and academic sources using search tools",
         system_message=system_message,
     )
@@ -174,7 +264,7 @@ def create_researcher_agent(config: Dict[str, Any], model_client: OpenAIChatComp
     return researcher
 
 
-def create_writer_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
+def create_writer_agent(config: Dict[str, Any], model_client: ChatCompletionClient) -> AssistantAgent:
     """
     Create a Writer Agent using AutoGen.
     
@@ -210,7 +300,7 @@ def create_writer_agent(config: Dict[str, Any], model_client: OpenAIChatCompleti
     return writer
 
 
-def create_critic_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
+def create_critic_agent(config: Dict[str, Any], model_client: ChatCompletionClient) -> AssistantAgent:
     """
     Create a Critic Agent using AutoGen.
     
@@ -251,6 +341,13 @@ def create_research_team(config: Dict[str, Any]) -> RoundRobinGroupChat:
     """
     Create the research team as a RoundRobinGroupChat.
     
+    Agents take turns in the order Planner -> Researcher -> Writer -> Critic,
+    and the rounds repeat until the Critic approves with TERMINATE, so a
+    draft the Critic rejects goes back around for revision.
+    
+    The Researcher's research_search tool runs the web and paper searches
+    concurrently, so the evidence-gathering step costs one model turn.
+    
     Args:
         config: Configuration dictionary
         
@@ -276,4 +373,3 @@ def create_research_team(config: Dict[str, Any]) -> RoundRobinGroupChat:
     )
     
     return team
-
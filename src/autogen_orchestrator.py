@@ -6,7 +6,8 @@ in a research workflow.
 
 Workflow:
 1. Planner: Breaks down the query into research steps
-2. Researcher: Gathers evidence using web and paper search tools
+2. Researcher: Gathers evidence with one research_search call, which runs
+   the web and paper searches concurrently
 3. Writer: Synthesizes findings into a coherent response
 4. Critic: Evaluates quality and provides feedback
 """
@@ -18,8 +19,9 @@ from typing import Dict, Any, List, Optional
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_agentchat.messages import TextMessage
 
-from src.agents.autogen_agents import create_research_team
+from src.agents.autogen_agents import close_model_clients, create_research_team
 from src.guardrails.safety_manager import SafetyManager
+from src.tools.http_session import close_sessions
 
 # Retry configuration for API failures
 MAX_RETRIES = 3
@@ -77,7 +79,7 @@ class AutoGenOrchestrator:
         self.logger.info(f"Processing query: {query}")
         
         # Check input safety first
-        safety_result = self.safety_manager.check_input_safety(query)
+        safety_result = await self.safety_manager.check_input_safety_async(query)
         if not safety_result.get("safe", True):
             self.logger.warning(f"Query blocked by safety check: {safety_result}")
             return {
@@ -97,16 +99,19 @@ class AutoGenOrchestrator:
                 try:
                     loop = asyncio.get_running_loop()
                     # We're in an async context - need to run directly
-                    # Create a new team to avoid event loop conflicts
-                    self.team = create_research_team(self.config)
-                    result = await self._process_query_async(query, max_rounds)
+                    # Create a new team to avoid event loop conflicts; it is
+                    # passed explicitly so concurrent queries don't share one
+                    team = create_research_team(self.config)
+                    self.team = team
+                    result = await self._process_query_async(query, max_rounds, team=team)
                 except RuntimeError:
                     # No running loop - use asyncio.run
                     result = asyncio.run(self._process_query_async(query, max_rounds))
                 
-                # Check output safety before returning
+                # Check output safety before returning (off the event loop,
+                # since responses can be long)
                 response_text = result.get("response", "")
-                output_safety = self.safety_manager.check_output_safety(response_text)
+                output_safety = await self.safety_manager.check_output_safety_async(response_text)
                 if output_safety.get("violations"):
                     result["metadata"]["safety_check"] = {
                         "passed": output_safety.get("safe", True),
@@ -138,13 +143,28 @@ class AutoGenOrchestrator:
                     "metadata": {"error": True}
                 }
     
-    async def _process_query_async(self, query: str, max_rounds: int = 20) -> Dict[str, Any]:
+    async def close(self):
+        """
+        Release network resources held for this event loop.
+
+        Call once the orchestrator is done, from the loop that ran the queries.
+        """
+        await close_model_clients()
+        await close_sessions()
+
+    async def _process_query_async(
+        self,
+        query: str,
+        max_rounds: int = 20,
+        team: Optional[RoundRobinGroupChat] = None
+    ) -> Dict[str, Any]:
         """
         Async implementation of query processing.
         
         Args:
             query: The research question to answer
             max_rounds: Maximum number of conversation rounds
+            team: Team to run the query on (defaults to self.team)
             
         Returns:
             Dictionary containing results
@@ -155,7 +175,8 @@ class AutoGenOrchestrator:
 Research and provide a brief answer with sources."""
         
         # Run the team
-        result = await self.team.run(task=task_message)
+        team = team or self.team
+        result = await team.run(task=task_message)
         
         # Extract conversation history
         messages = []
@@ -267,8 +288,8 @@ AutoGen Research Workflow:
    - Identifies key topics
    ↓
 3. Researcher (with tools)
-   - Uses web_search() tool
-   - Uses paper_search() tool
+   - Uses research_search() tool
+     (web search + paper search in parallel)
    - Gathers evidence
    - Collects citations
    ↓
@@ -295,15 +316,14 @@ def demonstrate_usage():
     
     This function shows a simple example of using the orchestrator.
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config import load_config
     
     # Load environment variables
     load_dotenv()
     
     # Load configuration
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
     
     # Create orchestrator
     orchestrator = AutoGenOrchestrator(config)
@@ -0,0 +1,45 @@
+"""
+Configuration Loader
+Loads config.yaml once per process and shares the parsed result.
+
+Example usage:
+    from src.config import load_config
+
+    config = load_config("config.yaml")
+    orchestrator = AutoGenOrchestrator(config)
+    evaluator = SystemEvaluator(config, orchestrator=orchestrator)
+"""
+
+from typing import Dict, Any
+import functools
+import os
+import yaml
+
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def load_config(path: str = "config.yaml") -> Dict[str, Any]:
+    """
+    Load and parse a YAML configuration file.
+
+    The parsed config is cached per file, so every component loading the
+    same file shares one dict. Treat it as read-only.
+
+    Args:
+        path: Path to the YAML configuration file
+
+    Returns:
+        Parsed configuration dictionary (empty if the file is empty)
+    """
+    return _load_config(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(path: str) -> Dict[str, Any]:
+    """Parse the config file at an absolute path (cached)."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
@@ -4,8 +4,7 @@ Runs batch evaluations and generates reports.
 
 Example usage:
     # Load config
-    with open("config.yaml") as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
     
     # Initialize evaluator with orchestrator
     evaluator = SystemEvaluator(config, orchestrator=my_orchestrator)
@@ -14,16 +13,75 @@ Example usage:
     report = await evaluator.evaluate_system("data/test_queries.json")
     
     # Results are automatically saved to outputs/
+
+    # Or consume results as each query finishes
+    async for result in evaluator.evaluate_system_stream("data/test_queries.json"):
+        print(result["query"])
+    report = evaluator.finalize_report()
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 import json
 import logging
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import Executor
 import asyncio
 
 from .judge import LLMJudge
+from src.tools.http_session import close_sessions
+
+
+class _RunningScores:
+    """
+    Running aggregates over evaluation results.
+
+    Keeps sums and counts instead of per-query score lists, so the summary
+    can be computed without holding on to every result.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.overall_sum = 0.0
+        self.criterion_sums: Dict[str, float] = {}
+        self.criterion_counts: Dict[str, int] = {}
+        self.best: Optional[Dict[str, Any]] = None
+        self.worst: Optional[Dict[str, Any]] = None
+        # Test-file index of the best/worst result, for breaking ties
+        self._best_index = 0
+        self._worst_index = 0
+
+    def add(self, result: Dict[str, Any], index: int):
+        """
+        Fold one evaluation result into the aggregates.
+
+        Args:
+            result: Evaluation result
+            index: Position of the query in the test file
+        """
+        self.total += 1
+        if "error" in result:
+            return
+
+        self.successful += 1
+        evaluation = result.get("evaluation", {})
+        score = evaluation.get("overall_score", 0.0)
+        self.overall_sum += score
+
+        for criterion, score_data in evaluation.get("criterion_scores", {}).items():
+            self.criterion_sums[criterion] = self.criterion_sums.get(criterion, 0.0) + score_data.get("score", 0.0)
+            self.criterion_counts[criterion] = self.criterion_counts.get(criterion, 0) + 1
+
+        # Results arrive in completion order, so ties go to the lower test
+        # file index, like max()/min() over the results in file order
+        entry = {"query": result.get("query", ""), "score": score}
+        if self.best is None or (-score, index) < (-self.best["score"], self._best_index):
+            self.best = entry
+            self._best_index = index
+        if self.worst is None or (score, index) < (self.worst["score"], self._worst_index):
+            self.worst = entry
+            self._worst_index = index
 
 
 class SystemEvaluator:
@@ -38,13 +96,19 @@ class SystemEvaluator:
     - Perform error analysis
     """
 
-    def __init__(self, config: Dict[str, Any], orchestrator=None):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        orchestrator=None,
+        executor: Optional[Executor] = None
+    ):
         """
         Initialize evaluator.
 
         Args:
             config: Configuration dictionary (from config.yaml)
             orchestrator: The orchestrator to evaluate
+            executor: Long-lived executor shared by the judge's blocking calls
         """
         self.config = config
         self.orchestrator = orchestrator
@@ -54,12 +118,18 @@ class SystemEvaluator:
         eval_config = config.get("evaluation", {})
         self.enabled = eval_config.get("enabled", True)
         self.max_test_queries = eval_config.get("num_test_queries", None)
+        # Number of test queries run concurrently (bounded by provider rate limits)
+        self.max_concurrency = max(1, eval_config.get("max_concurrency", 8))
         
         # Initialize judge (passes config to load judge model settings and criteria)
-        self.judge = LLMJudge(config)
+        self.judge = LLMJudge(config, executor=executor)
 
-        # Evaluation results
+        # Evaluation results and their running aggregates
         self.results: List[Dict[str, Any]] = []
+        # Test-file position of each entry in self.results, which fills up in
+        # completion order; finalize_report() restores the file order
+        self._result_positions: List[int] = []
+        self._scores = _RunningScores()
         
         self.logger.info(f"SystemEvaluator initialized (enabled={self.enabled})")
 
@@ -88,34 +158,136 @@ class SystemEvaluator:
             self.logger.warning("Evaluation is disabled in config.yaml")
             return {"error": "Evaluation is disabled in configuration"}
         
+        async for _ in self.evaluate_system_stream(test_queries_path):
+            pass
+
+        return self.finalize_report()
+
+    async def evaluate_system_stream(
+        self,
+        test_queries_path: str = "data/test_queries.json",
+        keep_results: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run system evaluation, yielding each result as soon as it completes.
+
+        Results arrive in completion order and are appended to
+        outputs/evaluation_<timestamp>.jsonl as they come in, so progress can
+        be followed with tail -f. Call finalize_report() afterwards for the
+        aggregate report, whose detailed results follow the test file order.
+
+        Args:
+            test_queries_path: Path to test queries JSON file
+            keep_results: Keep each result in self.results (needed for
+                detailed_results and export_for_report); pass False to keep
+                memory flat on large test sets
+
+        Yields:
+            Evaluation result for each test query
+        """
+        if not self.enabled:
+            self.logger.warning("Evaluation is disabled in config.yaml")
+            return
+
         self.logger.info("Starting system evaluation")
 
         # Load test queries
         test_queries = self._load_test_queries(test_queries_path)
         self.logger.info(f"Loaded {len(test_queries)} test queries")
 
-        # Evaluate each query
-        for i, test_case in enumerate(test_queries, 1):
-            self.logger.info(f"Evaluating query {i}/{len(test_queries)}")
+        output_dir = Path("outputs")
+        output_dir.mkdir(exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stream_file = output_dir / f"evaluation_{timestamp}.jsonl"
+
+        # Evaluate queries concurrently; the semaphore caps in-flight queries
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._run_one(semaphore, i, len(test_queries), test_case))
+            for i, test_case in enumerate(test_queries, 1)
+        ]
+
+        fh = open(stream_file, "w", encoding="utf-8")
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+
+                self._scores.add(result, index)
+                if keep_results:
+                    self.results.append(result)
+                    self._result_positions.append(index)
+
+                # Keep file I/O off the event loop
+                line = json.dumps(result, default=str) + "\n"
+                await asyncio.to_thread(self._write_line, fh, line)
+
+                yield result
+        finally:
+            # Stop outstanding queries if the consumer stopped early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            fh.close()
+            # Close the search tools' HTTP session for this loop
+            await close_sessions()
+
+        self.logger.info(f"Streamed results saved to {stream_file}")
+
+    def finalize_report(self) -> Dict[str, Any]:
+        """
+        Build the evaluation report from the results so far and save it.
 
-            try:
-                result = await self._evaluate_query(test_case)
-                self.results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error evaluating query {i}: {e}")
-                self.results.append({
-                    "query": test_case.get("query", ""),
-                    "error": str(e)
-                })
+        Streamed results are first put back in test file order.
 
-        # Aggregate results
-        report = self._generate_report()
+        Returns:
+            Evaluation results and statistics
+        """
+        ordered = sorted(zip(self._result_positions, self.results), key=lambda pair: pair[0])
+        self.results = [result for _, result in ordered]
+        self._result_positions = [index for index, _ in ordered]
 
-        # Save results
+        report = self._generate_report()
         self._save_results(report)
-
         return report
 
+    @staticmethod
+    def _write_line(fh, line: str):
+        """Append one line and flush so readers see it immediately."""
+        fh.write(line)
+        fh.flush()
+
+    async def _run_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        index: int,
+        total: int,
+        test_case: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Evaluate one test query once a concurrency slot is available.
+
+        Args:
+            semaphore: Semaphore bounding concurrent evaluations
+            index: 1-based position of the query in the test file
+            total: Total number of queries (for logging)
+            test_case: Test case with query and optional ground truth
+
+        Returns:
+            Tuple of the index and the evaluation result (or an error entry
+            if evaluation failed)
+        """
+        async with semaphore:
+            self.logger.info(f"Evaluating query {index}/{total}")
+
+            try:
+                return index, await self._evaluate_query(test_case)
+            except Exception as e:
+                self.logger.error(f"Error evaluating query {index}: {e}")
+                return index, {
+                    "query": test_case.get("query", ""),
+                    "error": str(e)
+                }
+
     async def _evaluate_query(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate a single test query.
@@ -205,59 +377,34 @@ class SystemEvaluator:
         - Analyze errors
         - Generate visualizations (optional)
         """
-        if not self.results:
+        scores = self._scores
+        if not scores.total:
             return {"error": "No results to report"}
 
-        # Calculate statistics
-        total_queries = len(self.results)
-        successful = [r for r in self.results if "error" not in r]
-        failed = [r for r in self.results if "error" in r]
-
-        # Aggregate scores
-        criterion_scores = {}
-        overall_scores = []
-
-        for result in successful:
-            evaluation = result.get("evaluation", {})
-            overall_scores.append(evaluation.get("overall_score", 0.0))
+        # Statistics come from the running aggregates, not the result list
+        total_queries = scores.total
+        failed = total_queries - scores.successful
 
-            # Collect scores by criterion
-            for criterion, score_data in evaluation.get("criterion_scores", {}).items():
-                if criterion not in criterion_scores:
-                    criterion_scores[criterion] = []
-                criterion_scores[criterion].append(score_data.get("score", 0.0))
-
-        # Calculate averages
-        avg_overall = sum(overall_scores) / len(overall_scores) if overall_scores else 0.0
-
-        avg_criterion_scores = {}
-        for criterion, scores in criterion_scores.items():
-            avg_criterion_scores[criterion] = sum(scores) / len(scores) if scores else 0.0
-
-        # Find best and worst
-        best_result = max(successful, key=lambda r: r.get("evaluation", {}).get("overall_score", 0.0)) if successful else None
-        worst_result = min(successful, key=lambda r: r.get("evaluation", {}).get("overall_score", 0.0)) if successful else None
+        avg_overall = scores.overall_sum / scores.successful if scores.successful else 0.0
+        avg_criterion_scores = {
+            criterion: total / scores.criterion_counts[criterion]
+            for criterion, total in scores.criterion_sums.items()
+        }
 
         report = {
             "timestamp": datetime.now().isoformat(),
             "summary": {
                 "total_queries": total_queries,
-                "successful": len(successful),
-                "failed": len(failed),
-                "success_rate": len(successful) / total_queries if total_queries > 0 else 0.0
+                "successful": scores.successful,
+                "failed": failed,
+                "success_rate": scores.successful / total_queries if total_queries > 0 else 0.0
             },
             "scores": {
                 "overall_average": avg_overall,
                 "by_criterion": avg_criterion_scores
             },
-            "best_result": {
-                "query": best_result.get("query", "") if best_result else "",
-                "score": best_result.get("evaluation", {}).get("overall_score", 0.0) if best_result else 0.0
-            } if best_result else None,
-            "worst_result": {
-                "query": worst_result.get("query", "") if worst_result else "",
-                "score": worst_result.get("evaluation", {}).get("overall_score", 0.0) if worst_result else 0.0
-            } if worst_result else None,
+            "best_result": dict(scores.best) if scores.best else None,
+            "worst_result": dict(scores.worst) if scores.worst else None,
             "detailed_results": self.results
         }
 
@@ -353,8 +500,8 @@ async def example_simple_evaluation():
         from src.evaluation.evaluator import example_simple_evaluation
         asyncio.run(example_simple_evaluation())
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config import load_config
     
     load_dotenv()
     
@@ -363,8 +510,7 @@ async def example_simple_evaluation():
     print("=" * 70)
     
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
     
     # Create test queries in memory (no file needed)
     test_queries = [
@@ -422,8 +568,8 @@ async def example_with_orchestrator():
         from src.evaluation.evaluator import example_with_orchestrator
         asyncio.run(example_with_orchestrator())
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config import load_config
     
     load_dotenv()
     
@@ -432,8 +578,7 @@ async def example_with_orchestrator():
     print("=" * 70)
     
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
     
     # Initialize orchestrator
     # TODO: YOUR CODE HERE
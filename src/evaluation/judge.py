@@ -22,6 +22,9 @@ from typing import Dict, Any, List, Optional
 import logging
 import json
 import os
+import asyncio
+import functools
+from concurrent.futures import Executor
 from openai import OpenAI
 
 
@@ -37,14 +40,17 @@ class LLMJudge:
     - Handle multiple judges/perspectives
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], executor: Optional[Executor] = None):
         """
         Initialize LLM judge.
 
         Args:
             config: Configuration dictionary (from config.yaml)
+            executor: Executor for the blocking judge API calls
+                (defaults to the event loop's default executor)
         """
         self.config = config
+        self.executor = executor
         self.logger = logging.getLogger("evaluation.judge")
 
         # Load judge model configuration from config.yaml (models.judge)
@@ -248,8 +254,11 @@ Provide your evaluation in the following JSON format:
             
             self.logger.debug(f"Calling LLM API with model: {model_name}")
             
-            # Call OpenAI-compatible API
-            chat_completion = self.client.chat.completions.create(
+            # Call OpenAI-compatible API in a worker thread so the blocking
+            # request doesn't stall other queries being evaluated concurrently
+            loop = asyncio.get_running_loop()
+            create = functools.partial(
+                self.client.chat.completions.create,
                 messages=[
                     {
                         "role": "system",
@@ -264,6 +273,7 @@ Provide your evaluation in the following JSON format:
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
+            chat_completion = await loop.run_in_executor(self.executor, create)
             
             response = chat_completion.choices[0].message.content
             self.logger.debug(f"Received response: {response[:100]}...")
@@ -323,14 +333,13 @@ async def example_basic_evaluation():
         from src.evaluation.judge import example_basic_evaluation
         asyncio.run(example_basic_evaluation())
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config import load_config
     
     load_dotenv()
     
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
     
     # Initialize judge
     judge = LLMJudge(config)
@@ -373,14 +382,13 @@ async def example_compare_responses():
         from src.evaluation.judge import example_compare_responses
         asyncio.run(example_compare_responses())
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config import load_config
     
     load_dotenv()
     
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config("config.yaml")
     
     # Initialize judge
     judge = LLMJudge(config)
@@ -6,6 +6,80 @@ Checks user inputs for safety violations.
 from typing import Dict, Any, List
 import re
 
+from .trie import trie_regex
+
+# Keyword lists and compiled patterns are shared by every instance, so they
+# are built once at import time rather than per InputGuardrail
+
+# Toxicity keywords (harmful/offensive content)
+_TOXIC_KEYWORDS = (
+    # Violence
+    "kill", "murder", "attack", "harm", "hurt", "violence", "weapon",
+    # Hateful content
+    "hate", "racist", "sexist", "discrimination",
+    # Illegal activities
+    "hack", "crack", "steal", "fraud", "illegal",
+    # Self-harm
+    "suicide", "self-harm",
+)
+
+# Prompt injection phrases, matched literally except that a space matches
+# any run of whitespace. Only the start of a match matters, so e.g.
+# "ignore previous instruction" also covers "...instructions".
+_INJECTION_PHRASES = (
+    # Instruction override
+    "ignore previous instruction",
+    "ignore all previous instruction",
+    "disregard previous",
+    "disregard all previous",
+    "override safety",
+    # Memory wipe
+    "forget everything",
+    # Role manipulation
+    "you are now",
+    "act as if",
+    "pretend you",
+    "admin mode",
+    "sudo ",
+    "jailbreak",
+    # Fake system turns
+    "system:",
+    "[system]",
+)
+
+# Prompt injection patterns that aren't plain phrases
+_INJECTION_PATTERNS = (
+    r"<\s*system\s*>",
+)
+
+# Every injection pattern starts with one of these literals, so text
+# containing none of them cannot match and the regex scan is skipped
+_INJECTION_ANCHORS = (
+    "ignore", "disregard", "forget", "you", "act", "pretend",
+    "system", "<", "[", "sudo", "admin", "override", "jailbreak",
+)
+
+# HCI-related keywords for relevance check
+_HCI_KEYWORDS = (
+    "user", "interface", "design", "usability", "accessibility",
+    "interaction", "experience", "ux", "ui", "human", "computer",
+    "hci", "research", "study", "evaluation", "prototype",
+    "mobile", "web", "app", "software", "system", "technology",
+    "ai", "ml", "machine learning", "artificial intelligence",
+    "visualization", "data", "display", "screen", "input", "output",
+)
+
+# Phrases and keywords are merged into trie-factored alternations so each
+# input position is rejected after following one branch
+_INJECTION_RE = re.compile(
+    "|".join((trie_regex(_INJECTION_PHRASES),) + _INJECTION_PATTERNS),
+    re.IGNORECASE
+)
+_TOXIC_RE = re.compile(r"\b(" + trie_regex(_TOXIC_KEYWORDS) + r")\b")
+# HCI keywords match anywhere in the text, like a substring check, so
+# inflected forms count too ("designing", "websites", "users")
+_HCI_RE = re.compile(trie_regex(_HCI_KEYWORDS))
+
 
 class InputGuardrail:
     """
@@ -17,6 +91,16 @@ class InputGuardrail:
     3. Topic Relevance (HCI research)
     """
 
+    toxic_keywords = _TOXIC_KEYWORDS
+    injection_phrases = _INJECTION_PHRASES
+    injection_patterns = _INJECTION_PATTERNS
+    hci_keywords = _HCI_KEYWORDS
+
+    _toxic_re = _TOXIC_RE
+    _injection_re = _INJECTION_RE
+    _injection_anchors = _INJECTION_ANCHORS
+    _hci_re = _HCI_RE
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize input guardrail.
@@ -25,52 +109,19 @@ class InputGuardrail:
             config: Configuration dictionary
         """
         self.config = config
-        
-        # Toxicity keywords (harmful/offensive content)
-        self.toxic_keywords = [
-            # Violence
-            "kill", "murder", "attack", "harm", "hurt", "violence", "weapon",
-            # Hateful content
-            "hate", "racist", "sexist", "discrimination",
-            # Illegal activities
-            "hack", "crack", "steal", "fraud", "illegal",
-            # Self-harm
-            "suicide", "self-harm",
-        ]
-        
-        # Prompt injection patterns
-        self.injection_patterns = [
-            r"ignore\s+(all\s+)?previous\s+instructions?",
-            r"disregard\s+(all\s+)?previous",
-            r"forget\s+everything",
-            r"you\s+are\s+now",
-            r"act\s+as\s+if",
-            r"pretend\s+you",
-            r"system:\s*",
-            r"<\s*system\s*>",
-            r"\[system\]",
-            r"sudo\s+",
-            r"admin\s+mode",
-            r"override\s+safety",
-            r"jailbreak",
-        ]
-        
-        # HCI-related keywords for relevance check
-        self.hci_keywords = [
-            "user", "interface", "design", "usability", "accessibility",
-            "interaction", "experience", "ux", "ui", "human", "computer",
-            "hci", "research", "study", "evaluation", "prototype",
-            "mobile", "web", "app", "software", "system", "technology",
-            "ai", "ml", "machine learning", "artificial intelligence",
-            "visualization", "data", "display", "screen", "input", "output"
-        ]
-
-    def validate(self, query: str) -> Dict[str, Any]:
+        # Stop scanning once a blocking (high severity) violation is found
+        self.fast_fail = config.get("fast_fail", True)
+        # Always run the full prompt injection scan (skip the anchor precheck)
+        self.strict = config.get("strict", False)
+
+    def validate(self, query: str, full_audit: bool = False) -> Dict[str, Any]:
         """
         Validate input query.
 
         Args:
             query: User input to validate
+            full_audit: Run every check even after a blocking violation
+                (overrides fast_fail, e.g. for audit logs)
 
         Returns:
             Validation result with 'valid', 'violations', and 'sanitized_input'
@@ -92,17 +143,19 @@ class InputGuardrail:
                 "severity": "medium"
             })
 
-        # Check for toxic language
-        toxic_violations = self._check_toxic_language(query)
-        violations.extend(toxic_violations)
-
-        # Check for prompt injection
-        injection_violations = self._check_prompt_injection(query)
-        violations.extend(injection_violations)
-
-        # Check for relevance (only warn, don't block)
-        relevance_violations = self._check_relevance(query)
-        violations.extend(relevance_violations)
+        # Toxic language, prompt injection, then relevance (only warns, never
+        # blocks). With fast_fail the remaining checks are skipped as soon as
+        # one of them blocks the query.
+        stop_on_block = self.fast_fail and not full_audit
+        for check in (
+            self._check_toxic_language,
+            self._check_prompt_injection,
+            self._check_relevance,
+        ):
+            new_violations = check(query)
+            violations.extend(new_violations)
+            if stop_on_block and any(v.get("severity") == "high" for v in new_violations):
+                break
 
         # Determine if query should be blocked (high severity = block)
         is_blocked = any(v.get("severity") == "high" for v in violations)
@@ -121,12 +174,9 @@ class InputGuardrail:
         violations = []
         text_lower = text.lower()
         
-        found_keywords = []
-        for keyword in self.toxic_keywords:
-            # Use word boundary matching to avoid false positives
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                found_keywords.append(keyword)
+        # Single pass with word boundary matching to avoid false positives;
+        # dict.fromkeys drops repeats while keeping first-seen order
+        found_keywords = list(dict.fromkeys(self._toxic_re.findall(text_lower)))
         
         if found_keywords:
             violations.append({
@@ -145,14 +195,23 @@ class InputGuardrail:
         violations = []
         text_lower = text.lower()
 
-        for pattern in self.injection_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                violations.append({
-                    "validator": "prompt_injection",
-                    "reason": f"Potential prompt injection detected",
-                    "severity": "high"
-                })
-                break  # One injection violation is enough
+        # Cheap substring precheck before the regex scan. Only safe for ASCII
+        # text: re.IGNORECASE also folds characters such as "ı" and "ſ" onto
+        # "i" and "s", which a plain substring test would miss
+        if (
+            not self.strict
+            and text_lower.isascii()
+            and not any(a in text_lower for a in self._injection_anchors)
+        ):
+            return violations
+
+        # One injection violation is enough
+        if self._injection_re.search(text_lower):
+            violations.append({
+                "validator": "prompt_injection",
+                "reason": f"Potential prompt injection detected",
+                "severity": "high"
+            })
 
         return violations
 
@@ -163,11 +222,11 @@ class InputGuardrail:
         violations = []
         query_lower = query.lower()
         
-        # Count how many HCI-related keywords appear
-        hci_matches = sum(1 for kw in self.hci_keywords if kw in query_lower)
+        # Look for any HCI-related keyword
+        has_hci_keyword = self._hci_re.search(query_lower) is not None
         
-        # If very few HCI keywords, it might be off-topic (but don't block)
-        if len(query) > 20 and hci_matches == 0:
+        # If no HCI keywords, it might be off-topic (but don't block)
+        if len(query) > 20 and not has_hci_keyword:
             violations.append({
                 "validator": "relevance",
                 "reason": "Query may not be related to HCI research topics",
@@ -3,9 +3,43 @@ Output Guardrail
 Checks system outputs for safety violations.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import itertools
 import re
 
+from .trie import trie_regex
+
+# Pattern tables and compiled patterns are shared by every instance, so they
+# are built once at import time rather than per OutputGuardrail
+
+# PII patterns
+_PII_PATTERNS = {
+    "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    "ssn": r'\b\d{3}-\d{2}-\d{4}\b',
+    "credit_card": r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
+}
+
+# Harmful content keywords
+_HARMFUL_KEYWORDS = (
+    "kill", "murder", "attack", "harm", "weapon",
+    "bomb", "explosive", "poison", "torture",
+)
+
+# Biased language patterns
+_BIAS_PATTERNS = (
+    r'\b(all|every)\s+(men|women|blacks|whites|asians)\s+(are|always)\b',
+    r'\b(never|always)\s+trust\s+(men|women|people\s+from)\b',
+    r'\bstereotyp(e|ing|ical)\b',
+)
+
+_PII_RES = {
+    pii_type: re.compile(pattern)
+    for pii_type, pattern in _PII_PATTERNS.items()
+}
+_HARMFUL_RE = re.compile(r"\b(" + trie_regex(_HARMFUL_KEYWORDS) + r")\b")
+_BIAS_RE = re.compile("|".join(_BIAS_PATTERNS), re.IGNORECASE)
+
 
 class OutputGuardrail:
     """
@@ -17,6 +51,14 @@ class OutputGuardrail:
     3. Bias Detection
     """
 
+    pii_patterns = _PII_PATTERNS
+    harmful_keywords = _HARMFUL_KEYWORDS
+    bias_patterns = _BIAS_PATTERNS
+
+    _pii_res = _PII_RES
+    _harmful_re = _HARMFUL_RE
+    _bias_re = _BIAS_RE
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize output guardrail.
@@ -25,63 +67,55 @@ class OutputGuardrail:
             config: Configuration dictionary
         """
         self.config = config
-        
-        # PII patterns
-        self.pii_patterns = {
-            "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            "ssn": r'\b\d{3}-\d{2}-\d{4}\b',
-            "credit_card": r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
-        }
-        
-        # Harmful content keywords
-        self.harmful_keywords = [
-            "kill", "murder", "attack", "harm", "weapon",
-            "bomb", "explosive", "poison", "torture",
-        ]
-        
-        # Biased language patterns
-        self.bias_patterns = [
-            r'\b(all|every)\s+(men|women|blacks|whites|asians)\s+(are|always)\b',
-            r'\b(never|always)\s+trust\s+(men|women|people\s+from)\b',
-            r'\bstereotyp(e|ing|ical)\b',
-        ]
+        # Stop scanning once a blocking (high severity) violation is found
+        self.fast_fail = config.get("fast_fail", True)
 
-    def validate(self, response: str, sources: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def validate(
+        self,
+        response: str,
+        sources: List[Dict[str, Any]] = None,
+        full_audit: bool = False
+    ) -> Dict[str, Any]:
         """
         Validate output response.
 
         Args:
             response: Generated response to validate
             sources: Optional list of sources used (for fact-checking)
+            full_audit: Run every check even after a blocking violation
+                (overrides fast_fail, e.g. for audit logs)
 
         Returns:
             Validation result
         """
-        violations = []
-
-        # Check for PII
-        pii_violations = self._check_pii(response)
-        violations.extend(pii_violations)
-
-        # Check for harmful content
-        harmful_violations = self._check_harmful_content(response)
-        violations.extend(harmful_violations)
-
-        # Check for bias
-        bias_violations = self._check_bias(response)
-        violations.extend(bias_violations)
+        # PII always runs and never short-circuits: it can be redacted, so the
+        # remaining checks must still run to tell whether redaction is enough
+        violations = self._check_pii(response)
+
+        # Harmful content, then bias. With fast_fail the remaining checks are
+        # skipped as soon as one of them blocks the response.
+        stop_on_block = self.fast_fail and not full_audit
+        for check in (
+            self._check_harmful_content,
+            self._check_bias,
+        ):
+            new_violations = check(response)
+            violations.extend(new_violations)
+            if stop_on_block and any(v.get("severity") == "high" for v in new_violations):
+                break
 
         # Determine if response should be blocked
         is_blocked = any(v.get("severity") == "high" for v in violations)
         
-        # Sanitize if there are PII violations
-        sanitized = self._sanitize(response, violations) if violations else response
+        # Redact only the offending spans, keeping the rest of the response
+        spans = self._pii_spans(response, violations) if violations else []
+        sanitized = self._sanitize(response, spans)
 
         return {
             "valid": not is_blocked,
             "violations": violations,
             "sanitized_output": sanitized,
+            "spans": spans,
             "blocked": is_blocked
         }
 
@@ -91,15 +125,17 @@ class OutputGuardrail:
         """
         violations = []
 
-        for pii_type, pattern in self.pii_patterns.items():
-            matches = re.findall(pattern, text)
+        for pii_type, pattern in self._pii_res.items():
+            # Only the first few matches are reported, so stop scanning there
+            # instead of collecting every match in the text
+            matches = [m.group(0) for m in itertools.islice(pattern.finditer(text), 5)]
             if matches:
                 violations.append({
                     "validator": "pii",
                     "pii_type": pii_type,
                     "reason": f"Contains {pii_type}",
                     "severity": "high",
-                    "matches": matches[:5]  # Limit matches shown
+                    "matches": matches  # Limit matches shown
                 })
 
         return violations
@@ -111,11 +147,8 @@ class OutputGuardrail:
         violations = []
         text_lower = text.lower()
         
-        found_keywords = []
-        for keyword in self.harmful_keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                found_keywords.append(keyword)
+        # Single pass over the text; dict.fromkeys drops repeated keywords
+        found_keywords = list(dict.fromkeys(self._harmful_re.findall(text_lower)))
         
         if found_keywords:
             violations.append({
@@ -134,14 +167,13 @@ class OutputGuardrail:
         violations = []
         text_lower = text.lower()
         
-        for pattern in self.bias_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                violations.append({
-                    "validator": "bias",
-                    "reason": "Response may contain biased language",
-                    "severity": "medium"
-                })
-                break  # One bias violation is enough
+        # One bias violation is enough
+        if self._bias_re.search(text_lower):
+            violations.append({
+                "validator": "bias",
+                "reason": "Response may contain biased language",
+                "severity": "medium"
+            })
 
         return violations
 
@@ -158,16 +190,58 @@ class OutputGuardrail:
         # Placeholder - complex fact-checking would require LLM
         return violations
 
-    def _sanitize(self, text: str, violations: List[Dict[str, Any]]) -> str:
-        """
-        Sanitize text by removing/redacting violations.
+    def _pii_spans(
+        self,
+        text: str,
+        violations: List[Dict[str, Any]]
+    ) -> List[Tuple[int, int, str]]:
         """
-        sanitized = text
+        Locate every match of the PII types found in the text.
 
-        # Redact PII
-        for violation in violations:
-            if violation.get("validator") == "pii":
-                for match in violation.get("matches", []):
-                    sanitized = sanitized.replace(str(match), "[REDACTED]")
+        Args:
+            text: Text that was validated
+            violations: Violations reported for the text
 
-        return sanitized
+        Returns:
+            Sorted, non-overlapping (start, end, tag) spans, where tag is the
+            replacement text, e.g. "[REDACTED_EMAIL]"
+        """
+        pii_types = {v.get("pii_type") for v in violations if v.get("validator") == "pii"}
+        if not pii_types:
+            return []
+
+        spans = []
+        for pii_type, pattern in self._pii_res.items():
+            if pii_type in pii_types:
+                tag = f"[REDACTED_{pii_type.upper()}]"
+                spans.extend((m.start(), m.end(), tag) for m in pattern.finditer(text))
+        spans.sort()
+
+        # Merge overlapping matches (e.g. from different PII patterns) so each
+        # character is redacted at most once; the earliest match's tag wins
+        merged = []
+        for start, end, tag in spans:
+            if merged and start < merged[-1][1]:
+                prev_start, prev_end, prev_tag = merged[-1]
+                merged[-1] = (prev_start, max(prev_end, end), prev_tag)
+            else:
+                merged.append((start, end, tag))
+
+        return merged
+
+    def _sanitize(self, text: str, spans: List[Tuple[int, int, str]]) -> str:
+        """
+        Sanitize text by replacing each span with its tag in one pass.
+        """
+        if not spans:
+            return text
+
+        parts = []
+        pos = 0
+        for start, end, tag in spans:
+            parts.append(text[pos:start])
+            parts.append(tag)
+            pos = end
+        parts.append(text[pos:])
+
+        return "".join(parts)
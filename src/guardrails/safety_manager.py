@@ -3,15 +3,187 @@ Safety Manager
 Coordinates safety guardrails and logs safety events.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
+from collections import OrderedDict, deque
+import asyncio
+import atexit
+import copy
+import hashlib
 import logging
+import math
 from datetime import datetime
 import json
 import os
+import threading
+import time
 
 from .input_guardrail import InputGuardrail
 from .output_guardrail import OutputGuardrail
 
+# orjson serializes straight to bytes and is several times faster than the
+# stdlib encoder; it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(record: Dict[str, Any]) -> bytes:
+    """Serialize a log record to UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record).encode("utf-8")
+
+
+# (second, formatted "YYYY-MM-DDTHH:MM:SS") for the last second formatted;
+# replaced as one tuple so concurrent readers never see a mismatched pair
+_ts_cache = (None, "")
+
+
+def _format_timestamp(ts_ns: int) -> str:
+    """
+    Format a time.time_ns() value like datetime.now().isoformat().
+
+    The date/time part is formatted once per second and reused for every
+    event within that second.
+    """
+    global _ts_cache
+    seconds, nanos = divmod(ts_ns, 1_000_000_000)
+    cached_seconds, prefix = _ts_cache
+    if cached_seconds != seconds:
+        prefix = datetime.fromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+def _event_record(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Public form of a safety event: ts_ns replaced by an ISO timestamp."""
+    record = {"timestamp": _format_timestamp(event["ts_ns"])}
+    record.update((k, v) for k, v in event.items() if k != "ts_ns")
+    return record
+
+
+class _SafetyLogWriter:
+    """
+    Appends safety events to a JSONL file in batches.
+
+    Events are queued in memory and written by a background thread, either
+    once SAFETY_BATCH_SIZE events are pending or every SAFETY_BATCH_MS
+    milliseconds, through one file handle kept open for the process. If the
+    queue is full, new events are dropped and counted rather than blocking
+    the caller.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 64,
+        batch_ms: float = 200,
+        max_pending: int = 10000
+    ):
+        """
+        Initialize log writer.
+
+        Args:
+            path: JSONL file to append events to
+            batch_size: Pending events that trigger an immediate flush
+            batch_ms: Maximum time between flushes in milliseconds
+            max_pending: Events held in memory before new ones are dropped
+        """
+        self.logger = logging.getLogger("safety")
+        self.batch_size = max(1, batch_size)
+        self.batch_interval = max(1.0, batch_ms) / 1000
+        self.max_pending = max_pending
+        self.dropped = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fp = open(path, "ab", buffering=1 << 16)
+        self._pending: deque = deque()
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._run, name="safety-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def write(self, event: Dict[str, Any]):
+        """Queue an event for writing (never blocks on I/O)."""
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append(event)
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        """Write all pending events in a single write() call."""
+        with self._flush_lock:
+            batch = []
+            while self._pending:
+                batch.append(self._pending.popleft())
+            if not batch:
+                return
+
+            try:
+                self._fp.write(b"".join(_dumps(_event_record(e)) + b"\n" for e in batch))
+                self._fp.flush()
+            except Exception as e:
+                self.logger.error(f"Failed to write safety log: {e}")
+
+    def _run(self):
+        """Flush on a full batch or when the interval elapses."""
+        while True:
+            self._wake.wait(self.batch_interval)
+            self._wake.clear()
+            self.flush()
+
+
+# One writer per log file, shared by every SafetyManager in the process
+_log_writers: Dict[str, _SafetyLogWriter] = {}
+_log_writers_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a numeric setting from the environment, falling back on bad values."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = float(value)
+        if not math.isfinite(number):
+            raise ValueError(value)
+        return number
+    except ValueError:
+        logging.getLogger("safety").warning(
+            f"Ignoring invalid {name}={value!r}, using {default}"
+        )
+        return default
+
+
+def _get_log_writer(path: str) -> Optional[_SafetyLogWriter]:
+    """
+    Get (or create) the shared writer for a log file.
+
+    Returns:
+        The writer, or None if the log file can't be opened (events are then
+        only kept in memory)
+    """
+    path = os.path.abspath(path)
+    with _log_writers_lock:
+        writer = _log_writers.get(path)
+        if writer is None:
+            try:
+                writer = _SafetyLogWriter(
+                    path,
+                    batch_size=int(_env_number("SAFETY_BATCH_SIZE", 64)),
+                    batch_ms=_env_number("SAFETY_BATCH_MS", 200),
+                )
+            except OSError as e:
+                logging.getLogger("safety").error(f"Failed to open safety log {path}: {e}")
+                return None
+            _log_writers[path] = writer
+        return writer
+
 
 class SafetyManager:
     """
@@ -37,13 +209,35 @@ class SafetyManager:
         self.log_events = config.get("log_events", True)
         self.logger = logging.getLogger("safety")
 
-        # Safety event log
-        self.safety_events: List[Dict[str, Any]] = []
+        # Recent safety events; older ones are evicted from memory but remain
+        # in logs/safety_events.jsonl
+        self.safety_events: deque = deque(maxlen=config.get("max_events_in_memory", 10000))
+        # Running event counts for get_safety_stats, covering evicted events
+        # too (checks may run in worker threads, hence the lock)
+        self._stat_total = 0
+        self._stat_input = 0
+        self._stat_output = 0
+        self._stat_violations = 0
+        self._stats_lock = threading.Lock()
+        # Batched writer for logs/safety_events.jsonl (None if the file can't
+        # be opened; events are then only kept in memory)
+        self._log_writer = (
+            _get_log_writer(os.path.join("logs", "safety_events.jsonl"))
+            if self.log_events else None
+        )
 
         # Initialize guardrails
         self.input_guardrail = InputGuardrail(config)
         self.output_guardrail = OutputGuardrail(config)
 
+        # LRU cache of guardrail verdicts keyed by content digest, so repeated
+        # queries and regenerated responses skip the validator scans
+        self.verdict_cache_size = config.get("verdict_cache_size", 4096)
+        self._verdict_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._verdict_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         # Prohibited categories (for documentation/logging)
         self.prohibited_categories = [
             "harmful_content",
@@ -75,7 +269,7 @@ class SafetyManager:
             return {"safe": True, "violations": []}
 
         # Use input guardrail
-        result = self.input_guardrail.validate(query)
+        result = self._cached_validate("input", query, self.input_guardrail.validate)
         
         is_safe = result.get("valid", True)
         violations = result.get("violations", [])
@@ -104,7 +298,7 @@ class SafetyManager:
             return {"safe": True, "response": response, "violations": []}
 
         # Use output guardrail
-        result = self.output_guardrail.validate(response)
+        result = self._cached_validate("output", response, self.output_guardrail.validate)
         
         is_safe = result.get("valid", True)
         violations = result.get("violations", [])
@@ -117,6 +311,13 @@ class SafetyManager:
         # Determine response based on safety result
         if not is_safe:
             action = self.on_violation.get("action", "refuse")
+            # If PII is the only problem, redacting it is enough; anything
+            # else flagged alongside it keeps the configured action
+            if self.on_violation.get("redact_pii", True) and all(
+                v.get("validator") == "pii" for v in violations
+            ):
+                action = "sanitize"
+
             if action == "sanitize":
                 final_response = sanitized
             elif action == "refuse":
@@ -137,16 +338,88 @@ class SafetyManager:
             "original_response": response if not is_safe else None
         }
 
+    async def check_input_safety_async(self, query: str) -> Dict[str, Any]:
+        """
+        Async version of check_input_safety for use on the event loop.
+
+        The checks run in a worker thread so concurrent queries aren't
+        stalled while the regex scans run.
+
+        Args:
+            query: User query to check
+
+        Returns:
+            Same result as check_input_safety
+        """
+        return await asyncio.to_thread(self.check_input_safety, query)
+
+    async def check_output_safety_async(self, response: str) -> Dict[str, Any]:
+        """
+        Async version of check_output_safety for use on the event loop.
+
+        Args:
+            response: Generated response to check
+
+        Returns:
+            Same result as check_output_safety
+        """
+        return await asyncio.to_thread(self.check_output_safety, response)
+
+    def _cached_validate(
+        self,
+        kind: str,
+        content: str,
+        validate: Callable[[str], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run a guardrail, reusing the verdict for previously seen content.
+
+        Args:
+            kind: "input" or "output" (part of the cache key)
+            content: Content to validate
+            validate: Guardrail validate function to run on a cache miss
+
+        Returns:
+            Guardrail validation result (a copy callers may modify)
+        """
+        # Hash the full content: a partial hash could hand a cached "safe"
+        # verdict to content that differs only in the unhashed part
+        digest = hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        key = (kind, digest)
+
+        with self._verdict_cache_lock:
+            result = self._verdict_cache.get(key)
+            if result is not None:
+                self._verdict_cache.move_to_end(key)
+                self._cache_hits += 1
+
+        if result is None:
+            result = validate(content)
+            with self._verdict_cache_lock:
+                self._cache_misses += 1
+                if self.verdict_cache_size > 0:
+                    self._verdict_cache[key] = result
+                    if len(self._verdict_cache) > self.verdict_cache_size:
+                        self._verdict_cache.popitem(last=False)
+
+        return copy.deepcopy(result)
+
+    def clear_verdict_cache(self):
+        """Drop cached verdicts (e.g. after the guardrail config changes)."""
+        with self._verdict_cache_lock:
+            self._verdict_cache.clear()
+
     def _get_violation_message(self, violations: List[Dict[str, Any]]) -> str:
         """Generate user-friendly message for violations."""
         if not violations:
             return ""
         
-        # Get highest severity violation
-        high_severity = [v for v in violations if v.get("severity") == "high"]
-        
-        if high_severity:
-            v = high_severity[0]
+        # Get the first high severity violation, if any
+        v = next((v for v in violations if v.get("severity") == "high"), None)
+
+        if v is not None:
             validator = v.get("validator", "safety")
             if validator == "toxicity":
                 return "I cannot process this query as it may contain harmful content."
@@ -176,16 +449,25 @@ class SafetyManager:
             violations: List of violations found
             is_safe: Whether content passed safety checks
         """
+        # Raw clock reading; formatted only when the event is written out
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.time_ns(),
             "type": event_type,
             "safe": is_safe,
             "violations": violations,
             "content_preview": content[:100] + "..." if len(content) > 100 else content
         }
 
-        self.safety_events.append(event)
-        
+        with self._stats_lock:
+            self.safety_events.append(event)
+            self._stat_total += 1
+            if event_type == "input":
+                self._stat_input += 1
+            elif event_type == "output":
+                self._stat_output += 1
+            if not is_safe:
+                self._stat_violations += 1
+
         # Log to console
         if is_safe:
             self.logger.info(f"Safety check passed: {event_type}")
@@ -194,20 +476,15 @@ class SafetyManager:
             for v in violations:
                 self.logger.warning(f"  - {v.get('validator')}: {v.get('reason')}")
 
-        # Write to safety log file if configured
-        log_dir = "logs"
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, "safety_events.jsonl")
-        
-        try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event) + "\n")
-        except Exception as e:
-            self.logger.error(f"Failed to write safety log: {e}")
+        # Queue for the safety log file; written in batches off this thread
+        if self._log_writer is not None:
+            self._log_writer.write(event)
 
     def get_safety_events(self) -> List[Dict[str, Any]]:
-        """Get all logged safety events."""
-        return self.safety_events
+        """Get the most recent logged safety events (up to max_events_in_memory)."""
+        with self._stats_lock:
+            events = list(self.safety_events)
+        return [_event_record(e) for e in events]
 
     def get_safety_stats(self) -> Dict[str, Any]:
         """
@@ -216,19 +493,30 @@ class SafetyManager:
         Returns:
             Dictionary with safety statistics
         """
-        total = len(self.safety_events)
-        input_events = sum(1 for e in self.safety_events if e["type"] == "input")
-        output_events = sum(1 for e in self.safety_events if e["type"] == "output")
-        violations = sum(1 for e in self.safety_events if not e["safe"])
+        with self._stats_lock:
+            total = self._stat_total
+            input_events = self._stat_input
+            output_events = self._stat_output
+            violations = self._stat_violations
+        lookups = self._cache_hits + self._cache_misses
 
         return {
             "total_events": total,
             "input_checks": input_events,
             "output_checks": output_events,
             "violations": violations,
-            "violation_rate": violations / total if total > 0 else 0
+            "violation_rate": violations / total if total > 0 else 0,
+            "log_events_dropped": self._log_writer.dropped if self._log_writer else 0,
+            "verdict_cache_hits": self._cache_hits,
+            "verdict_cache_misses": self._cache_misses,
+            "verdict_cache_hit_rate": self._cache_hits / lookups if lookups > 0 else 0
         }
 
     def clear_events(self):
         """Clear safety event log."""
-        self.safety_events = []
+        with self._stats_lock:
+            self.safety_events.clear()
+            self._stat_total = 0
+            self._stat_input = 0
+            self._stat_output = 0
+            self._stat_violations = 0
@@ -0,0 +1,76 @@
+"""
+Trie Regex
+Builds a single regex from a list of literal phrases.
+
+A plain "a|b|c" alternation makes the regex engine try every alternative
+at each position of the input. Merging the phrases into a trie first
+factors out shared prefixes (e.g. "hack", "hate", "harm" -> "ha(?:ck|rm|te)"),
+so each position is rejected after following a single branch.
+
+Example usage:
+    pattern = trie_regex(["kill", "killer", "self-harm"])
+    toxic_re = re.compile(r"\\b(" + pattern + r")\\b")
+"""
+
+from typing import Dict, Iterable, Optional
+import re
+
+# Marks the end of a phrase inside a trie node
+_END = ""
+
+
+def trie_regex(phrases: Iterable[str]) -> str:
+    """
+    Compile literal phrases into one prefix-factored regex pattern.
+
+    Phrases are matched literally, except that a space matches one or more
+    whitespace characters. Only non-capturing groups are used, so the result
+    can be wrapped in a capturing group for findall().
+
+    Args:
+        phrases: Literal phrases to match
+
+    Returns:
+        Regex pattern string (not compiled)
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+
+    return _node_pattern(trie) or ""
+
+
+def _atom(char: str) -> str:
+    """Regex for a single phrase character."""
+    return r"\s+" if char == " " else re.escape(char)
+
+
+def _node_pattern(node: Dict[str, dict]) -> Optional[str]:
+    """Regex for everything below a trie node (None if it is a leaf)."""
+    branches = []
+    # Characters that end a phrase with nothing after them collapse into
+    # one character class
+    leaves = []
+
+    for char in sorted(k for k in node if k != _END):
+        tail = _node_pattern(node[char])
+        if tail is None and char != " ":
+            leaves.append(re.escape(char))
+        else:
+            branches.append(_atom(char) + (tail or ""))
+
+    if leaves:
+        branches.append(leaves[0] if len(leaves) == 1 else "[" + "".join(leaves) + "]")
+    if not branches:
+        return None
+
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    # A phrase also ends here; "?" is greedy, so longer phrases still win
+    if _END in node:
+        pattern = "(?:" + pattern + ")?"
+
+    return pattern
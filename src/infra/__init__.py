@@ -0,0 +1,11 @@
+"""
+Infrastructure Module
+Shared runtime components used by the agents (LLM request scheduling, etc.).
+"""
+
+from .llm_worker import InferenceWorker, QueuedChatCompletionClient
+
+__all__ = [
+    "InferenceWorker",
+    "QueuedChatCompletionClient",
+]
@@ -0,0 +1,137 @@
+"""
+LLM Inference Worker
+Bounds the number of concurrent chat completion requests.
+
+When several queries run concurrently (e.g. during evaluation), every agent
+turn issues its own chat completion request. The worker lets at most
+max_in_flight of them run at the provider at once; each request starts as
+soon as a slot is free, without waiting for unrelated ones to finish.
+
+Example usage:
+    client = OpenAIChatCompletionClient(...)
+    worker = InferenceWorker(client, max_in_flight=4)
+    queued_client = QueuedChatCompletionClient(client, worker)
+
+    # Use queued_client anywhere a ChatCompletionClient is expected
+    agent = AssistantAgent(name="Planner", model_client=queued_client)
+"""
+
+from typing import Any, Optional, Sequence
+import asyncio
+import logging
+
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+)
+
+
+class InferenceWorker:
+    """
+    Bounds concurrent chat completion requests from many callers.
+
+    Each submit() call waits for one of max_in_flight slots and then runs
+    its request in the caller's own task, so cancelling a caller cancels
+    its request and nothing is left waiting when the worker is closed.
+    """
+
+    def __init__(self, client: ChatCompletionClient, max_in_flight: int = 8):
+        """
+        Initialize inference worker.
+
+        Args:
+            client: Underlying chat completion client that serves requests
+            max_in_flight: Maximum number of requests running at the provider
+        """
+        self.client = client
+        self.max_in_flight = max(1, max_in_flight)
+        self.logger = logging.getLogger("infra.llm_worker")
+
+        # Created lazily on the running event loop (see _get_slots)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def submit(self, *args: Any, **kwargs: Any) -> CreateResult:
+        """
+        Run a chat completion request once an in-flight slot is free.
+
+        Args:
+            *args: Positional arguments for ChatCompletionClient.create
+            **kwargs: Keyword arguments for ChatCompletionClient.create
+
+        Returns:
+            The CreateResult produced by the underlying client
+        """
+        async with self._get_slots():
+            return await self.client.create(*args, **kwargs)
+
+    async def close(self):
+        """Forget the slots; requests still running finish in their callers."""
+        self._loop = None
+        self._slots = None
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Return the slot semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        # asyncio.run() creates a fresh loop per call, so rebuild if it changed
+        if self._slots is None or self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        return self._slots
+
+
+class QueuedChatCompletionClient(ChatCompletionClient):
+    """
+    ChatCompletionClient that sends create() calls through an InferenceWorker.
+
+    Streaming, token counting and usage tracking are delegated directly to
+    the wrapped client.
+    """
+
+    def __init__(self, client: ChatCompletionClient, worker: InferenceWorker):
+        """
+        Initialize queued client.
+
+        Args:
+            client: Underlying chat completion client
+            worker: Worker that dispatches create() requests for this client
+        """
+        self.client = client
+        self.worker = worker
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        """Run a chat completion request through the worker."""
+        return await self.worker.submit(*args, **kwargs)
+
+    def create_stream(self, *args: Any, **kwargs: Any):
+        """Stream a chat completion directly from the wrapped client."""
+        return self.client.create_stream(*args, **kwargs)
+
+    async def close(self) -> None:
+        """Stop the worker and close the wrapped client."""
+        await self.worker.close()
+        await self.client.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self.client.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.client.total_usage()
+
+    def count_tokens(self, messages: Sequence[LLMMessage], **kwargs: Any) -> int:
+        return self.client.count_tokens(messages, **kwargs)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], **kwargs: Any) -> int:
+        return self.client.remaining_tokens(messages, **kwargs)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:
+        return self.client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self.client.model_info
@@ -0,0 +1,79 @@
+"""
+Shared HTTP Session
+One aiohttp session per event loop, shared by the search tools.
+
+Reusing a session keeps connections alive across searches. aiohttp sessions
+are bound to the event loop that created them, so each loop gets its own
+session; sessions left behind by loops that have since closed are discarded
+the next time a session is requested.
+
+Example usage:
+    session = await get_session()
+    async with session.get(url) as response:
+        ...
+
+    # On shutdown, from the same event loop
+    await close_sessions()
+"""
+
+from typing import Any, Dict
+import asyncio
+import logging
+
+logger = logging.getLogger("tools.http_session")
+
+# Maps event loop -> aiohttp.ClientSession
+_sessions: Dict[asyncio.AbstractEventLoop, Any] = {}
+
+
+async def get_session():
+    """
+    Get the shared aiohttp session for the running event loop.
+
+    Returns:
+        aiohttp.ClientSession (opened on first use)
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    await _discard_stale_sessions()
+
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32)
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_sessions():
+    """
+    Close the running loop's session and any left behind by closed loops.
+
+    Safe to call when no session was ever opened. A later get_session() call
+    opens a fresh session.
+    """
+    await _discard_stale_sessions()
+
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _discard_stale_sessions():
+    """Close and forget sessions whose event loop has been closed."""
+    for loop in [loop for loop in _sessions if loop.is_closed()]:
+        session = _sessions.pop(loop)
+        if session.closed:
+            continue
+        try:
+            await session.close()
+        except RuntimeError as e:
+            # The connections belong to the dead loop and can't be shut down
+            # cleanly; detach them so the session is marked closed anyway
+            logger.debug(f"Discarding session from closed event loop: {e}")
+            session.detach()
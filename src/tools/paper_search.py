@@ -8,9 +8,22 @@ of academic papers.
 """
 
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+import copy
 import os
 import logging
-import asyncio
+import time
+
+from .http_session import get_session
+
+# Semantic Scholar Academic Graph API
+_API_URL = "https://api.semanticscholar.org/graph/v1"
+
+# Recent search results, shared by every PaperSearchTool so repeated queries
+# in a session skip the API round-trip. Maps key -> (expires_at, papers).
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_TTL = 900  # seconds
+_search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
 
 
 class PaperSearchTool:
@@ -39,6 +52,8 @@ class PaperSearchTool:
         if not self.api_key:
             self.logger.info("No Semantic Scholar API key found. Using anonymous access (lower rate limits)")
 
+        self._headers = {"x-api-key": self.api_key} if self.api_key else {}
+
     async def search(
         self,
         query: str,
@@ -74,38 +89,51 @@ class PaperSearchTool:
         """
         self.logger.info(f"Searching papers: {query}")
 
-        try:
-            from semanticscholar import SemanticScholar
-            
-            # Initialize Semantic Scholar client
-            sch = SemanticScholar(api_key=self.api_key)
-            
-            # Define fields to retrieve
-            fields = kwargs.get("fields", [
-                "paperId", "title", "authors", "year", "abstract",
-                "citationCount", "url", "venue", "openAccessPdf"
-            ])
-            
-            # Perform search
-            results = sch.search_paper(
-                query, 
-                limit=self.max_results,
-                fields=fields
-            )
-            
-            # Parse and filter results
-            papers = self._parse_results(results, year_from, year_to, min_citations)
-            
-            self.logger.info(f"Found {len(papers)} papers")
-            return papers
-            
-        except ImportError:
-            self.logger.error("semanticscholar library not installed. Run: pip install semanticscholar")
-            return []
-        except Exception as e:
-            self.logger.error(f"Error searching papers: {e}")
+        # Define fields to retrieve
+        fields = kwargs.get("fields", [
+            "paperId", "title", "authors", "year", "abstract",
+            "citationCount", "url", "venue", "openAccessPdf"
+        ])
+
+        cache_key = (
+            query.strip().lower(), year_from, year_to, min_citations,
+            self.max_results, tuple(fields)
+        )
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_papers = cached
+            if expires_at > time.monotonic():
+                _search_cache.move_to_end(cache_key)
+                self.logger.info(f"Found {len(cached_papers)} papers (cached)")
+                return copy.deepcopy(cached_papers)
+            del _search_cache[cache_key]
+        params = {
+            "query": query,
+            "limit": self.max_results,
+            "fields": ",".join(fields),
+        }
+        # Let the API apply the filters too, so the limited result slots
+        # aren't spent on papers that would be filtered out
+        if year_from or year_to:
+            params["year"] = f"{year_from or ''}-{year_to or ''}"
+        if min_citations:
+            params["minCitationCount"] = min_citations
+
+        data = await self._get("/paper/search", params)
+        if data is None:
             return []
 
+        # Parse and filter results
+        papers = self._parse_results(data.get("data") or [], year_from, year_to, min_citations)
+
+        # Failed requests returned above, so only real responses are cached
+        _search_cache[cache_key] = (time.monotonic() + _SEARCH_CACHE_TTL, copy.deepcopy(papers))
+        if len(_search_cache) > _SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+
+        self.logger.info(f"Found {len(papers)} papers")
+        return papers
+
     async def get_paper_details(self, paper_id: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific paper.
@@ -116,27 +144,25 @@ class PaperSearchTool:
         Returns:
             Detailed paper information
         """
-        try:
-            from semanticscholar import SemanticScholar
-            
-            sch = SemanticScholar(api_key=self.api_key)
-            paper = sch.get_paper(paper_id)
-            
-            return {
-                "paper_id": paper.paperId,
-                "title": paper.title,
-                "authors": [{"name": a.name} for a in paper.authors] if paper.authors else [],
-                "year": paper.year,
-                "abstract": paper.abstract,
-                "citation_count": paper.citationCount,
-                "url": paper.url,
-                "venue": paper.venue,
-                "pdf_url": paper.openAccessPdf.get("url") if paper.openAccessPdf else None,
-            }
-        except Exception as e:
-            self.logger.error(f"Error getting paper details: {e}")
+        params = {
+            "fields": "paperId,title,authors,year,abstract,citationCount,url,venue,openAccessPdf",
+        }
+        paper = await self._get(f"/paper/{paper_id}", params)
+        if not paper:
             return {}
 
+        return {
+            "paper_id": paper.get("paperId"),
+            "title": paper.get("title"),
+            "authors": [{"name": a.get("name")} for a in paper.get("authors") or []],
+            "year": paper.get("year"),
+            "abstract": paper.get("abstract"),
+            "citation_count": paper.get("citationCount"),
+            "url": paper.get("url"),
+            "venue": paper.get("venue"),
+            "pdf_url": (paper.get("openAccessPdf") or {}).get("url"),
+        }
+
     async def get_citations(self, paper_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get papers that cite this paper.
@@ -148,25 +174,16 @@ class PaperSearchTool:
         Returns:
             List of citing papers
         """
-        try:
-            from semanticscholar import SemanticScholar
-            
-            sch = SemanticScholar(api_key=self.api_key)
-            paper = sch.get_paper(paper_id)
-            citations = paper.citations[:limit] if paper.citations else []
-            
-            return [
-                {
-                    "paper_id": c.paperId,
-                    "title": c.title,
-                    "year": c.year,
-                }
-                for c in citations
-            ]
-        except Exception as e:
-            self.logger.error(f"Error getting citations: {e}")
+        params = {"fields": "paperId,title,year", "limit": limit}
+        data = await self._get(f"/paper/{paper_id}/citations", params)
+        if data is None:
             return []
 
+        return [
+            self._brief_paper(item.get("citingPaper") or {})
+            for item in (data.get("data") or [])[:limit]
+        ]
+
     async def get_references(self, paper_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get papers referenced by this paper.
@@ -178,24 +195,53 @@ class PaperSearchTool:
         Returns:
             List of referenced papers
         """
+        params = {"fields": "paperId,title,year", "limit": limit}
+        data = await self._get(f"/paper/{paper_id}/references", params)
+        if data is None:
+            return []
+
+        return [
+            self._brief_paper(item.get("citedPaper") or {})
+            for item in (data.get("data") or [])[:limit]
+        ]
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Make a GET request to the Semantic Scholar API.
+
+        Args:
+            path: Endpoint path below the API root (e.g. "/paper/search")
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response, or None if the request failed
+        """
         try:
-            from semanticscholar import SemanticScholar
-            
-            sch = SemanticScholar(api_key=self.api_key)
-            paper = sch.get_paper(paper_id)
-            references = paper.references[:limit] if paper.references else []
-            
-            return [
-                {
-                    "paper_id": r.paperId,
-                    "title": r.title,
-                    "year": r.year,
-                }
-                for r in references
-            ]
+            session = await get_session()
+
+            async with session.get(
+                _API_URL + path, params=params, headers=self._headers
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                self.logger.error(f"Semantic Scholar API error: {response.status}")
+                return None
+
+        except ImportError:
+            self.logger.error("aiohttp not installed. Run: pip install aiohttp")
+            return None
         except Exception as e:
-            self.logger.error(f"Error getting references: {e}")
-            return []
+            self.logger.error(f"Semantic Scholar request error: {e}")
+            return None
+
+    @staticmethod
+    def _brief_paper(paper: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a citing/cited paper entry."""
+        return {
+            "paper_id": paper.get("paperId"),
+            "title": paper.get("title"),
+            "year": paper.get("year"),
+        }
 
     def _parse_results(
         self,
@@ -208,7 +254,7 @@ class PaperSearchTool:
         Parse and filter search results from Semantic Scholar.
         
         Args:
-            results: Raw results from Semantic Scholar API
+            results: Paper objects from the "data" field of a search response
             year_from: Minimum year filter
             year_to: Maximum year filter
             min_citations: Minimum citation count filter
@@ -217,65 +263,50 @@ class PaperSearchTool:
             Filtered and formatted list of papers
         """
         papers = []
-        count = 0
-        
+        has_year_filter = bool(year_from or year_to)
+
+        # Single pass: read each field once and filter inline
         for paper in results:
-            # Enforce strict limit - stop iterating once we have enough
-            if count >= self.max_results:
+            if len(papers) >= self.max_results:
                 break
-                
+
             # Skip papers without basic metadata
-            if not paper or not hasattr(paper, 'title'):
+            if not paper or "title" not in paper:
                 continue
-                
-            paper_dict = {
-                "paper_id": paper.paperId if hasattr(paper, 'paperId') else None,
-                "title": paper.title if hasattr(paper, 'title') else "Unknown",
-                "authors": [{"name": a.name} for a in paper.authors][:2] if hasattr(paper, 'authors') and paper.authors else [],  # Limit authors
-                "year": paper.year if hasattr(paper, 'year') else None,
-                "abstract": (paper.abstract[:50] + "..." if len(paper.abstract) > 50 else paper.abstract) if hasattr(paper, 'abstract') and paper.abstract else "",  # Truncate abstract early
-                "citation_count": paper.citationCount if hasattr(paper, 'citationCount') else 0,
-                "url": paper.url if hasattr(paper, 'url') else "",
+
+            year = paper.get("year")
+            if has_year_filter:
+                if year_from and not (year and year >= year_from):
+                    continue
+                if year_to and not (year and year <= year_to):
+                    continue
+
+            citation_count = paper.get("citationCount") or 0
+            if citation_count < min_citations:
+                continue
+
+            authors = paper.get("authors")
+            abstract = paper.get("abstract")
+
+            papers.append({
+                "paper_id": paper.get("paperId"),
+                "title": paper["title"],
+                "authors": [{"name": a.get("name")} for a in authors[:2]] if authors else [],  # Limit authors
+                "year": year,
+                "abstract": (abstract[:50] + "..." if len(abstract) > 50 else abstract) if abstract else "",  # Truncate abstract early
+                "citation_count": citation_count,
+                "url": paper.get("url", ""),
                 "venue": "",  # Skip venue to save tokens
                 "pdf_url": None,  # Skip PDF URL to save tokens
-            }
-            
-            papers.append(paper_dict)
-            count += 1
-        
-        # Apply filters (but still respect max_results)
-        papers = self._filter_by_year(papers, year_from, year_to)
-        papers = self._filter_by_citations(papers, min_citations)
-        
-        return papers[:self.max_results]
+            })
 
-    def _filter_by_year(
-        self,
-        papers: List[Dict[str, Any]],
-        year_from: Optional[int],
-        year_to: Optional[int]
-    ) -> List[Dict[str, Any]]:
-        """Filter papers by publication year."""
-        filtered = papers
-        if year_from:
-            filtered = [p for p in filtered if p.get("year") and p.get("year") >= year_from]
-        if year_to:
-            filtered = [p for p in filtered if p.get("year") and p.get("year") <= year_to]
-        return filtered
-
-    def _filter_by_citations(
-        self,
-        papers: List[Dict[str, Any]],
-        min_citations: int
-    ) -> List[Dict[str, Any]]:
-        """Filter papers by citation count."""
-        return [p for p in papers if p.get("citation_count", 0) >= min_citations]
+        return papers
 
 
-# Synchronous wrapper for use with AutoGen tools
-def paper_search(query: str, max_results: int = 3, year_from: Optional[int] = None) -> str:
+# Async wrapper for use with AutoGen tools (FunctionTool awaits coroutines)
+async def paper_search(query: str, max_results: int = 3, year_from: Optional[int] = None) -> str:
     """
-    Synchronous wrapper for paper search (for AutoGen tool integration).
+    Async wrapper for paper search (for AutoGen tool integration).
     
     Args:
         query: Search query
@@ -288,22 +319,22 @@ def paper_search(query: str, max_results: int = 3, year_from: Optional[int] = No
     # Strictly limit max_results to prevent token overflow (Groq free tier limit: 6000 tokens)
     max_results = min(max_results, 3)
     tool = PaperSearchTool(max_results=max_results)
-    results = asyncio.run(tool.search(query, year_from=year_from))
+    results = await tool.search(query, year_from=year_from)
     
     if not results:
         return "No academic papers found."
     
     # Format results as minimal readable text
-    output = f"Found {len(results)} papers:\n"
-    
+    parts = [f"Found {len(results)} papers:"]
+
     for i, paper in enumerate(results, 1):
         authors = ", ".join([a["name"] for a in paper["authors"][:2]])
         if len(paper["authors"]) > 2:
             authors += " et al."
-            
-        output += f"{i}. {paper['title']} ({paper['year']})\n"
-        output += f"   {authors}\n"
+
+        parts.append(f"{i}. {paper['title']} ({paper['year']})")
+        parts.append(f"   {authors}")
         if paper.get('abstract'):
-            output += f"   {paper['abstract']}\n"
-    
-    return output
+            parts.append(f"   {paper['abstract']}")
+
+    return "\n".join(parts) + "\n"
@@ -0,0 +1,33 @@
+"""
+Research Search Tool
+Runs web search and academic paper search together as a single tool call.
+
+Exposing both searches behind one tool lets the Researcher gather all of its
+evidence in one model turn, while the two searches themselves run
+concurrently.
+"""
+
+from typing import Optional
+import asyncio
+
+from .web_search import web_search
+from .paper_search import paper_search
+
+
+async def research_search(query: str, year_from: Optional[int] = None) -> str:
+    """
+    Search the web and academic papers concurrently (for AutoGen tool integration).
+
+    Args:
+        query: Search query
+        year_from: Only return papers from this year onwards
+
+    Returns:
+        Formatted string with web results followed by paper results
+    """
+    web_results, paper_results = await asyncio.gather(
+        web_search(query),
+        paper_search(query, year_from=year_from),
+    )
+
+    return f"Web results:\n{web_results}\nAcademic papers:\n{paper_results}"
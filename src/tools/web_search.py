@@ -9,7 +9,8 @@ It supports both Tavily and Brave Search APIs.
 from typing import List, Dict, Any, Optional
 import os
 import logging
-import asyncio
+
+from .http_session import get_session
 
 
 class WebSearchTool:
@@ -88,9 +89,9 @@ class WebSearchTool:
         Search using Tavily API.
         """
         try:
-            from tavily import TavilyClient
+            from tavily import AsyncTavilyClient
             
-            client = TavilyClient(api_key=self.api_key)
+            client = AsyncTavilyClient(api_key=self.api_key)
             
             # Tavily search parameters
             search_depth = kwargs.get("search_depth", "basic")
@@ -98,7 +99,7 @@ class WebSearchTool:
             exclude_domains = kwargs.get("exclude_domains", [])
             
             # Perform search
-            response = client.search(
+            response = await client.search(
                 query=query,
                 max_results=self.max_results,
                 search_depth=search_depth,
@@ -122,7 +123,7 @@ class WebSearchTool:
         Brave Search is a privacy-focused alternative to Google.
         """
         try:
-            import aiohttp
+            session = await get_session()
             
             url = "https://api.search.brave.com/res/v1/web/search"
             headers = {
@@ -135,15 +136,14 @@ class WebSearchTool:
                 "count": self.max_results,
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_brave_results(data)
-                    else:
-                        self.logger.error(f"Brave API error: {response.status}")
-                        return []
-                        
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return self._parse_brave_results(data)
+                else:
+                    self.logger.error(f"Brave API error: {response.status}")
+                    return []
+                    
         except ImportError:
             self.logger.error("aiohttp not installed. Run: pip install aiohttp")
             return []
@@ -211,10 +211,10 @@ class WebSearchTool:
         return [r for r in results if r.get("score", 0) >= min_score]
 
 
-# Synchronous wrapper for use with AutoGen tools
-def web_search(query: str, provider: str = "tavily", max_results: int = 2) -> str:
+# Async wrapper for use with AutoGen tools (FunctionTool awaits coroutines)
+async def web_search(query: str, provider: str = "tavily", max_results: int = 2) -> str:
     """
-    Synchronous wrapper for web search (for AutoGen tool integration).
+    Async wrapper for web search (for AutoGen tool integration).
     
     Args:
         query: Search query
@@ -227,18 +227,18 @@ def web_search(query: str, provider: str = "tavily", max_results: int = 2) -> st
     # Strictly limit max_results to prevent token overflow (Groq free tier)
     max_results = min(max_results, 2)
     tool = WebSearchTool(provider=provider, max_results=max_results)
-    results = asyncio.run(tool.search(query))
+    results = await tool.search(query)
     
     if not results:
         return "No search results found."
     
     # Format results as minimal readable text
-    output = f"Found {len(results)} results:\n"
-    
+    parts = [f"Found {len(results)} results:"]
+
     for i, result in enumerate(results, 1):
         # Truncate snippet to save tokens
         snippet = result['snippet'][:100] + "..." if len(result['snippet']) > 100 else result['snippet']
-        output += f"{i}. {result['title']}\n"
-        output += f"   {snippet}\n"
-    
-    return output
+        parts.append(f"{i}. {result['title']}")
+        parts.append(f"   {snippet}")
+
+    return "\n".join(parts) + "\n"
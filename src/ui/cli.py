@@ -12,14 +12,37 @@ sys.path.insert(0, str(project_root))
 
 import asyncio
 from typing import Dict, Any
-import yaml
+import io
 import logging
-from dotenv import load_dotenv
+import re
 
-from src.autogen_orchestrator import AutoGenOrchestrator
+# URLs cited in agent messages
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Maximum number of citations displayed per result
+_MAX_CITATIONS = 10
+
+# Flattens line breaks in message previews
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+
+def _preview(content: str, limit: int) -> str:
+    """Single-line preview of a message, truncated to limit characters."""
+    # Slice first so the tail of long messages is never scanned
+    preview = content[:limit].translate(_NL_TABLE)
+    return preview + "..." if len(content) > limit else preview
+
+
+def _collect_citations(content: str, seen: set, citations: list):
+    """Append new URLs from content to citations, up to _MAX_CITATIONS."""
+    for match in _URL_RE.finditer(content):
+        url = match.group()
+        if url not in seen:
+            seen.add(url)
+            citations.append(url)
+            if len(citations) >= _MAX_CITATIONS:
+                return
 
-# Load environment variables
-load_dotenv()
 
 class CLI:
     """
@@ -41,9 +64,12 @@ class CLI:
         Args:
             config_path: Path to configuration file
         """
+        # Imported here so importing this module (e.g. for --help) stays cheap
+        from src.autogen_orchestrator import AutoGenOrchestrator
+        from src.config import load_config
+
         # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
 
         # Setup logging
         self._setup_logging()
@@ -70,9 +96,11 @@ class CLI:
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
+        # Log to stdout so errors appear inline with the CLI output
         logging.basicConfig(
             level=getattr(logging, log_level),
-            format=log_format
+            format=log_format,
+            stream=sys.stdout
         )
 
     async def run(self):
@@ -124,17 +152,17 @@ class CLI:
                     self._display_result(result)
                     
                 except Exception as e:
-                    print(f"\nError processing query: {e}")
-                    logging.exception("Error processing query")
-                    logging.exception("Error processing query")
+                    # Logged to stdout, so this is the only place the error is shown
+                    self.logger.exception(f"Error processing query: {e}")
 
             except KeyboardInterrupt:
                 print("\n\nInterrupted by user.")
                 self._print_goodbye()
                 break
             except Exception as e:
-                print(f"\nError: {e}")
-                logging.exception("Error in CLI loop")
+                self.logger.exception(f"Error in CLI loop: {e}")
+
+        await self.orchestrator.close()
 
     def _print_welcome(self):
         """Print welcome message."""
@@ -174,85 +202,80 @@ class CLI:
 
     def _display_result(self, result: Dict[str, Any]):
         """Display query result with formatting."""
-        print("\n" + "=" * 70)
-        print("RESPONSE")
-        print("=" * 70)
+        # Write the whole block at once rather than one print per line
+        sys.stdout.write(self._format_result(result))
+        sys.stdout.flush()
+
+    def _format_result(self, result: Dict[str, Any]) -> str:
+        """Format a query result for display."""
+        buf = io.StringIO()
+        write = buf.write
+
+        write("\n" + "=" * 70 + "\n")
+        write("RESPONSE\n")
+        write("=" * 70 + "\n")
 
         # Check for safety blocks
         metadata = result.get("metadata", {})
         if metadata.get("blocked"):
-            print("\n" + "!" * 70)
-            print("SAFETY ALERT: Query was blocked")
-            print("!" * 70)
+            write("\n" + "!" * 70 + "\n")
+            write("SAFETY ALERT: Query was blocked\n")
+            write("!" * 70 + "\n")
             violations = metadata.get("safety_violations", [])
             for v in violations:
-                print(f"  - {v.get('validator', 'unknown')}: {v.get('reason', '')}")
-            print(f"\nResponse: {result.get('response', '')}")
-            print("=" * 70 + "\n")
-            return
+                write(f"  - {v.get('validator', 'unknown')}: {v.get('reason', '')}\n")
+            write(f"\nResponse: {result.get('response', '')}\n")
+            write("=" * 70 + "\n\n")
+            return buf.getvalue()
 
         # Check for errors
         if "error" in result:
-            print(f"\nError: {result['error']}")
-            return
+            write(f"\nError: {result['error']}\n")
+            return buf.getvalue()
 
         # Display response
         response = result.get("response", "")
-        print(f"\n{response}\n")
+        write(f"\n{response}\n\n")
 
-        # Display agent traces (always show for transparency)
+        # Display agent traces (always show for transparency), collecting
+        # cited URLs in the same pass over the conversation
         conversation = result.get("conversation_history", [])
+        citations = []
+        seen = set()
         if conversation:
-            print("\n" + "-" * 70)
-            print("AGENT TRACES")
-            print("-" * 70)
+            write("\n" + "-" * 70 + "\n")
+            write("AGENT TRACES\n")
+            write("-" * 70 + "\n")
             for msg in conversation:
                 agent = msg.get("source", "Unknown")
                 content = msg.get("content", "")
-                preview = content[:200] + "..." if len(content) > 200 else content
-                preview = preview.replace("\n", " ")
-                print(f"\n[{agent}]:")
-                print(f"  {preview}")
+                write(f"\n[{agent}]:\n")
+                write(f"  {_preview(content, 200)}\n")
+                if len(citations) < _MAX_CITATIONS:
+                    _collect_citations(content, seen, citations)
 
-        # Extract and display citations from conversation
-        citations = self._extract_citations(result)
+        # Display citations from conversation
         if citations:
-            print("\n" + "-" * 70)
-            print("CITATIONS & SOURCES")
-            print("-" * 70)
+            write("\n" + "-" * 70 + "\n")
+            write("CITATIONS & SOURCES\n")
+            write("-" * 70 + "\n")
             for i, citation in enumerate(citations, 1):
-                print(f"[{i}] {citation}")
+                write(f"[{i}] {citation}\n")
 
         # Display metadata
         if metadata:
-            print("\n" + "-" * 70)
-            print("METADATA")
-            print("-" * 70)
-            print(f"  Messages: {metadata.get('num_messages', 0)}")
-            print(f"  Sources: {metadata.get('num_sources', 0)}")
+            write("\n" + "-" * 70 + "\n")
+            write("METADATA\n")
+            write("-" * 70 + "\n")
+            write(f"  Messages: {metadata.get('num_messages', 0)}\n")
+            write(f"  Sources: {metadata.get('num_sources', 0)}\n")
             if metadata.get('safety_check'):
                 safety = metadata['safety_check']
-                print(f"  Safety Check: {'PASSED' if safety.get('passed') else 'FLAGGED'}")
+                write(f"  Safety Check: {'PASSED' if safety.get('passed') else 'FLAGGED'}\n")
 
-        print("=" * 70 + "\n")
+        write("=" * 70 + "\n\n")
+        return buf.getvalue()
     
-    def _extract_citations(self, result: Dict[str, Any]) -> list:
-        """Extract citations/URLs from conversation history."""
-        citations = []
-        
-        for msg in result.get("conversation_history", []):
-            content = msg.get("content", "")
-            
-            # Find URLs in content
-            import re
-            urls = re.findall(r'https?://[^\s<>"{}|\\^`\[\]]+', content)
-            
-            for url in urls:
-                if url not in citations:
-                    citations.append(url)
-        
-        return citations[:10]  # Limit to top 10
-
     def _should_show_traces(self) -> bool:
         """Check if agent traces should be displayed."""
         # Check config for verbose mode
@@ -271,12 +294,8 @@ class CLI:
             agent = msg.get("source", "Unknown")
             content = msg.get("content", "")
             
-            # Truncate long content
-            preview = content[:150] + "..." if len(content) > 150 else content
-            preview = preview.replace("\n", " ")
-            
             print(f"\n{i}. {agent}:")
-            print(f"   {preview}")
+            print(f"   {_preview(content, 150)}")
 
 
 def main():
@@ -294,6 +313,10 @@ def main():
 
     args = parser.parse_args()
 
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
+
     # Run CLI
     cli = CLI(config_path=args.config)
     asyncio.run(cli.run())
@@ -14,12 +14,12 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 import asyncio
-import yaml
 from datetime import datetime
 from typing import Dict, Any
 from dotenv import load_dotenv
 
 from src.autogen_orchestrator import AutoGenOrchestrator
+from src.config import load_config as load_config_file
 
 # Load environment variables
 load_dotenv()
@@ -29,8 +29,7 @@ def load_config():
     """Load configuration file."""
     config_path = Path("config.yaml")
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_config_file(str(config_path))
     return {}
 
 